@@ -1,36 +1,76 @@
 #!/usr/bin/env python3
+import asyncio
+import sys
 import requests
+from requests.adapters import HTTPAdapter
 import html
 import json
-from types import NoneType
 from typing import Literal, LiteralString, Sequence
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from datetime import datetime, timedelta
 
+import aiohttp
 import click
-from bs4 import BeautifulSoup
-from bs4.element import PageElement, ResultSet
+import lxml.html
+from lxml import etree
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# orjson parses the dict-heavy card payloads ~3x faster and takes bytes
+# directly; stdlib json also accepts bytes, so either works behind _loads.
+_loads = orjson.loads if orjson is not None else json.loads
+
+# One reusable simdjson Parser amortizes its internal buffers across every
+# card and hands back lazy proxies, so only the fields a Deal actually
+# reads ever materialize into Python objects.
+_PARSER = simdjson.Parser() if simdjson is not None else None
+
+# Sold-out cards carry a zeroed compare_at_price_min; spotting the marker in
+# the raw bytes skips them without parsing their JSON at all.
+_SOLDOUT = b'"compare_at_price_min": 0,'
+
+# Compiled once, evaluated in C on every page; pulls the card JSON text
+# straight out of the tree without building element wrappers. The class
+# test matches tokens (like the old soup lookup) rather than the exact
+# attribute value, so extra classes on the script tag stay harmless.
+_CARD_XPATH = etree.XPath(
+    '//script[contains(concat(" ", normalize-space(@class), " "),'
+    ' " bc-sf-filter-product-script ")]/text()'
+)
+
+# The shop always serves UTF-8 (declared in the Content-Type header, which
+# lxml never sees when fed raw bytes), so pin the parser encoding rather
+# than trusting meta-tag sniffing.
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+@dataclass(slots=True, frozen=True)
 class Deal:
     id: int
     title: LiteralString
-    original_price: float
-    current_price: float
+    original_price_cents: int
+    current_price_cents: int
     seller: LiteralString
-    path: Path
+    url: str
     available: bool
 
     def __repr__(self) -> str:
         return f'''Deal(
     id={self.id},
-    title={self.id},
+    title={self.title},
     original_price={self.original_price},
     current_price={self.current_price},
     seller={self.seller},
-    path={self.path},
+    url={self.url},
     available={self.available},
         )'''
 
@@ -38,29 +78,49 @@ class Deal:
     def from_json(cls, data: dict):
         if not isinstance(data, dict):
             raise TypeError('Must instantiate from dict type')
-        
-        return cls(
-            id=data['id'],
-            title=data['title'],
-            original_price=float(data['variants'][0]['compare_at_price']) / 100 
-                if not isinstance(data['variants'][0]['compare_at_price'], NoneType) 
-                else None,
-            current_price=float(data['variants'][0]['price']) / 100
-                if not isinstance(data['variants'][0]['price'], NoneType) 
-                else None,
-            seller=data['vendor'],
-            path=Path(html.unescape(data['url'])),
-            available=True if data['available'] else False
-        )
+
+        return _build_deal(data)
 
 
+    # Prices stay as the exact integer cents the shop serves; the dollar
+    # floats only exist at display time.
+    @property
+    def original_price(self):
+        return self.original_price_cents / 100 \
+            if self.original_price_cents is not None \
+            else None
+
+    @property
+    def current_price(self):
+        return self.current_price_cents / 100 \
+            if self.current_price_cents is not None \
+            else None
+
     @property
     def savings_amount(self):
-        return self.original_price - self.current_price
-    
+        return (self.original_price_cents - self.current_price_cents) / 100
+
     @property
     def savings_percentage(self):
-        return self.current_price / self.original_price
+        return self.current_price_cents / self.original_price_cents
+
+
+def _build_deal(data: dict) -> Deal:
+    # The whole per-card hot loop funnels through this one typed function;
+    # it takes anything subscriptable like a dict (including simdjson's lazy
+    # proxies) and is shaped so mypyc/Cython could compile it unchanged.
+    variant: dict = data['variants'][0]
+    return Deal(
+        id=data['id'],
+        title=html.unescape(data['title']),
+        original_price_cents=variant['compare_at_price'],
+        current_price_cents=variant['price'],
+        # a catalog repeats the same handful of vendors; interning collapses
+        # the duplicate strings every parse would otherwise allocate
+        seller=sys.intern(data['vendor']),
+        url=html.unescape(data['url']),
+        available=bool(data['available'])
+    )
 
 
 @dataclass
@@ -80,23 +140,83 @@ class BJJFanaticsScraper:
 
     BASE_URL = 'https://bjjfanatics.com/collections/daily-deals'
 
-    
+    # How many speculative page fetches stay in flight at once; past the end
+    # the server returns an empty page, so overshooting costs at most a few
+    # cheap requests per crawl.
+    PAGE_WINDOW = 4
+
+    # One shared session for the sync path: the TLS handshake is paid once
+    # and connections are pooled/kept alive across page fetches. Responses
+    # arrive gzipped now that nothing forces identity encoding.
+    _session = requests.Session()
+    _session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+    _session.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+
     @classmethod
     def get_all_deals(cls) -> DailyDeals:
-        pg = 1
-        curr_page = DailyDeals('', '', [1])
-        total_deals = []
-        while not curr_page.is_empty:
-            curr_page = cls.get_deals(pg)
-            total_deals.extend(curr_page.deals)
-            pg += 1
-        
+        return asyncio.run(cls._get_all_deals())
+
+    @classmethod
+    async def _get_all_deals(cls) -> DailyDeals:
+        async with aiohttp.ClientSession() as session:
+            info_task = asyncio.create_task(cls._get_deals_info_async(session))
+            total_deals = []
+            # Keep PAGE_WINDOW fetches in flight and consume them in page
+            # order: each parsed page tops the window back up, and the first
+            # empty page cancels whatever is still on the wire.
+            window = {
+                p: asyncio.create_task(cls._request_page(session, p))
+                for p in range(1, 1 + cls.PAGE_WINDOW)
+            }
+            pg = 1
+            try:
+                while True:
+                    cards = await window.pop(pg)
+                    if len(cards) == 0:
+                        break
+                    total_deals.extend(cls._parse_deals(cards))
+                    ahead = pg + cls.PAGE_WINDOW
+                    window[ahead] = asyncio.create_task(cls._request_page(session, ahead))
+                    pg += 1
+            except BaseException:
+                info_task.cancel()
+                raise
+            finally:
+                for task in window.values():
+                    task.cancel()
+                await asyncio.gather(*window.values(), info_task, return_exceptions=True)
+            deals_info = await info_task
+
+        updated_date = datetime.fromisoformat(deals_info['updated_at'])
         return DailyDeals(
-            updated_date=curr_page.updated_date,
-            expiry_date=curr_page.expiry_date,
+            updated_date=updated_date,
+            expiry_date=updated_date + timedelta(days=1),
             deals=total_deals
         )
 
+    @classmethod
+    async def _request_page(cls, session: aiohttp.ClientSession, pg: int) -> Sequence[str]:
+        params = {'page': pg}
+
+        async with session.get(cls.BASE_URL, params=params) as res:
+            res.raise_for_status()
+            # feed the page into the parser chunk by chunk so whole bodies
+            # never pile up in memory while several pages are in flight
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+            async for chunk in res.content.iter_chunked(65536):
+                parser.feed(chunk)
+            return _CARD_XPATH(parser.close())
+
+    @classmethod
+    async def _get_deals_info_async(cls, session: aiohttp.ClientSession) -> dict:
+        async with session.get(
+            cls.BASE_URL + '.json',
+            headers={'Accept': 'application/json'}
+        ) as res:
+            res.raise_for_status()
+            return _loads(await res.read())['collection']
+
     @classmethod
     def get_deals(cls, pg: int = 1) -> DailyDeals:
         return cls._list_deals(pg=pg)
@@ -106,56 +226,64 @@ class BJJFanaticsScraper:
         cards = cls._request_cards(pg=pg)
         deals_data = cls._parse_deals(cards)
         deals_info = cls._get_deals_info()
+        updated_date = datetime.fromisoformat(deals_info['updated_at'])
         deals = DailyDeals(
-            updated_date=datetime.fromisoformat(deals_info['updated_at']),
-            expiry_date=datetime.fromisoformat(deals_info['updated_at']) + timedelta(days=1),
+            updated_date=updated_date,
+            expiry_date=updated_date + timedelta(days=1),
             deals=deals_data
         )
         return deals
     
+    # The collection metadata is identical for every page, so fetch it once
+    # per process instead of once per _list_deals call.
     @classmethod
+    @lru_cache(maxsize=1)
     def _get_deals_info(cls) -> dict:
-        res = requests.get(
+        res = cls._session.get(
             url=BJJFanaticsScraper.BASE_URL + '.json',
             headers={'Accept': 'application/json'}
             )
-        data = json.loads(res.content)
+        data = _loads(res.content)
         return data['collection']
         
 
     @classmethod
-    def _request_cards(cls, pg) -> Sequence[PageElement]:
-        headers = {'Accept-Encoding': 'identity'}
+    def _request_cards(cls, pg) -> Sequence[str]:
         params = {'page': pg}
-        
-        res = requests.get(
+
+        res = cls._session.get(
             url=BJJFanaticsScraper.BASE_URL,
             params=params,
-            headers=headers
+            stream=True
         )
 
         if res.status_code != requests.codes.ok:
             raise requests.exceptions.RequestException(res)
-        
-        soup = BeautifulSoup(html.unescape(res.text), 'html.parser')
-        
-        with open('example.html', 'w', encoding="utf-8") as f:
-            f.write(res.text)
 
-        cards: Sequence[PageElement] = soup.find_all(
-            name='script',
-            attrs={'class':'bc-sf-filter-product-script'}
-        )
+        # lxml pulls from the response file-like itself, so the page goes
+        # socket -> parser without ever landing in one Python buffer;
+        # decode_content lets urllib3 gunzip as the parser reads.
+        res.raw.decode_content = True
+        with res:
+            tree = etree.parse(res.raw, _HTML_PARSER)
+        return _CARD_XPATH(tree)
 
 
-        return cards
-    
-
     @staticmethod
-    def _parse_deals(cards: Sequence[PageElement]) -> Sequence[Deal]:
+    def _parse_deals(cards: Sequence[str]) -> Sequence[Deal]:
         if not isinstance(cards, Sequence):
-            raise TypeError('Can only parse a Sequence containing PageElements.')
-        return [Deal.from_json(json.loads(card.get_text())) for card in cards if '"compare_at_price_min": 0,' not in card.get_text()]
+            raise TypeError('Can only parse a Sequence of card JSON strings.')
+
+        raws = [raw for card in cards if _SOLDOUT not in (raw := card.encode())]
+        if not raws:
+            return []
+
+        # One array-shaped parse amortizes per-call parser overhead across
+        # the whole page instead of paying it once per card.
+        batch = b'[' + b','.join(raws) + b']'
+
+        docs = _PARSER.parse(batch) if _PARSER is not None else _loads(batch)
+        return [_build_deal(doc) for doc in docs]
 
 
 